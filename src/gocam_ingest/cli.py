@@ -72,6 +72,33 @@ def download_gocam_models(output_dir: Path = Path("data/gocam_models")):
         raise typer.Exit(1)
 
 
+def write_run_config(jsonl_file: Path, output_dir: Path) -> Path:
+    """Write a run-scoped Koza config for `jsonl_file` into `output_dir`.
+
+    The packaged transform.yaml is used as a template and left untouched, so
+    several runs can share one (possibly read-only) install.
+    """
+    package_dir = Path(__file__).parent.resolve()
+
+    with open(package_dir / "transform.yaml", 'r') as f:
+        transform_config = yaml.safe_load(f)
+
+    # Point at the combined JSONL file and the packaged metadata and transform code by absolute path
+    transform_config['files'] = [str(jsonl_file.resolve())]
+    transform_config['format'] = 'jsonl'
+    transform_config['metadata'] = str(package_dir / "metadata.yaml")
+    transform_config['transform_code'] = str(package_dir / "transform.py")
+
+    # Remove file_archive field if present
+    transform_config.pop('file_archive', None)
+
+    run_config_file = output_dir / "transform.yaml"
+    with open(run_config_file, 'w') as f:
+        yaml.dump(transform_config, f, default_flow_style=False, sort_keys=False)
+
+    return run_config_file
+
+
 @app.command()
 def download(force: bool = typer.Option(False, help="Force download of data, even if it exists")):
     """Download GOCAM models."""
@@ -137,31 +164,15 @@ def prepare(
     
     typer.echo(f"Conversion complete. Created {combined_jsonl_file} with {len(all_models)} models")
     
-    # Update transform.yaml with the single JSONL file
-    transform_yaml_path = Path(__file__).parent / "transform.yaml"
-    typer.echo(f"Updating {transform_yaml_path} with combined JSONL file...")
-    
-    # Read current transform.yaml as YAML
-    with open(transform_yaml_path, 'r') as f:
-        transform_config = yaml.safe_load(f)
-    
-    # Update to use single combined JSONL file and set format to jsonl
-    transform_config['files'] = [f"./{combined_jsonl_file}"]
-    transform_config['format'] = 'jsonl'
-    
-    # Remove file_archive field if present
-    if 'file_archive' in transform_config:
-        del transform_config['file_archive']
-    
-    # Write back as YAML
-    with open(transform_yaml_path, 'w') as f:
-        yaml.dump(transform_config, f, default_flow_style=False, sort_keys=False)
-    
-    typer.echo(f"Updated {transform_yaml_path} to use combined JSONL file with {len(all_models)} models")
+    run_config_file = write_run_config(combined_jsonl_file, output_path)
+    typer.echo(f"Wrote run config {run_config_file} using combined JSONL file with {len(all_models)} models")
 
 
 @app.command()
 def transform(
+    config: str = typer.Option(
+        "data/gocam_models_converted_json/transform.yaml", help="Run config written by `prepare`"
+    ),
     output_dir: str = typer.Option("output", help="Output directory for transformed data"),
     row_limit: int = typer.Option(None, help="Number of rows to process"),
     verbose: int = typer.Option(False, help="Whether to be verbose"),
@@ -169,10 +180,14 @@ def transform(
     """Run the Koza transform for gocam_ingest."""
     from koza.cli_utils import transform_source
     
+    config_path = Path(config)
+    if not config_path.exists():
+        typer.echo(f"Config {config_path} does not exist, run `ingest prepare` first")
+        raise typer.Exit(1)
+
     typer.echo("Transforming data for gocam_ingest...")
-    transform_code = Path(__file__).parent / "transform.yaml"
     transform_source(
-        source=transform_code,
+        source=str(config_path),
         output_dir=output_dir,
         output_format="tsv",
         row_limit=row_limit,
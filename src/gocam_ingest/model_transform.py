@@ -0,0 +1,215 @@
+"""Koza-independent transform of GOCAM models into biolink nodes and edges."""
+import os
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from biolink_model.datamodel.pydanticmodel_v2 import (
+    Association,
+    BiologicalProcessOrActivity,
+    Entity,
+    Gene,
+    MolecularActivity,
+)
+
+GENE_PREFIXES = ['ZFIN', 'MGI', 'RGD', 'SGD', 'FlyBase', 'WormBase', 'TAIR']
+
+
+def extract_curie_prefix(curie: str) -> str:
+    """Extract the prefix from a CURIE (e.g., 'GO' from 'GO:0003674')."""
+    return curie.split(':')[0] if ':' in curie else ''
+
+
+def determine_node_category(entity_id: str, entity_type: str = None) -> list:
+    """Determine the biolink category for an entity based on its ID prefix."""
+    prefix = extract_curie_prefix(entity_id)
+
+    if prefix in GENE_PREFIXES:
+        return ["biolink:Gene"]
+    elif prefix == 'GO':
+        if entity_type and 'molecular_function' in entity_type.lower():
+            return ["biolink:MolecularActivity"]
+        elif entity_type and 'biological_process' in entity_type.lower():
+            return ["biolink:BiologicalProcess"]
+        else:
+            return ["biolink:Entity"]
+    elif prefix == 'ECO':
+        return ["biolink:EvidenceType"]
+    elif prefix == 'PMID':
+        return ["biolink:Publication"]
+    elif prefix == 'NCBITaxon':
+        return ["biolink:OrganismTaxon"]
+    elif 'gomodel:' in entity_id:
+        return ["biolink:BiologicalProcessOrActivity"]
+    else:
+        return ["biolink:Entity"]
+
+
+def get_entity_class_and_category(entity_id: str, entity_type: str = None):
+    """Get the appropriate biolink class and category for an entity."""
+    prefix = extract_curie_prefix(entity_id)
+
+    if prefix in GENE_PREFIXES:
+        return Gene, ["biolink:Gene"]
+    elif prefix == 'GO':
+        if entity_type and 'molecular_function' in entity_type.lower():
+            return MolecularActivity, ["biolink:MolecularActivity"]
+        elif entity_type and 'biological_process' in entity_type.lower():
+            return BiologicalProcessOrActivity, ["biolink:BiologicalProcessOrActivity"]
+        else:
+            return Entity, ["biolink:Entity"]
+    elif 'gomodel:' in entity_id:
+        return BiologicalProcessOrActivity, ["biolink:BiologicalProcessOrActivity"]
+    else:
+        return Entity, ["biolink:Entity"]
+
+
+def transform_model(model_data: dict) -> tuple[list, list]:
+    """Transform a single GOCAM model document into biolink nodes and edges.
+
+    Args:
+        model_data: A GOCAM model as loaded from its YAML/JSON representation.
+
+    Returns:
+        A ``(nodes, edges)`` tuple of biolink pydantic objects.
+    """
+    nodes = []
+    edges = []
+
+    title = model_data.get('title', '')
+
+    # Track all entities to avoid duplicates
+    entities_written = set()
+
+    # Process objects section for entity metadata
+    objects_dict = {}
+    for obj in model_data.get('objects') or []:
+        obj_id = obj.get('id')
+        if obj_id:
+            objects_dict[obj_id] = {'label': obj.get('label', ''), 'type': obj.get('type', '')}
+
+    # Process activities
+    for activity in model_data.get('activities') or []:
+        activity_id = activity.get('id')
+        if not activity_id:
+            continue
+
+        # Create activity node
+        if activity_id not in entities_written:
+            entity_class, category = get_entity_class_and_category(activity_id)
+            nodes.append(entity_class(id=activity_id, name=f"Activity from {title}", category=category))
+            entities_written.add(activity_id)
+
+        # Process enabled_by relationship
+        if 'enabled_by' in activity:
+            enabled_by = activity['enabled_by']
+            gene_id = enabled_by.get('term')
+
+            if gene_id:
+                # Create gene entity
+                if gene_id not in entities_written:
+                    gene_label = objects_dict.get(gene_id, {}).get('label', gene_id)
+                    entity_class, category = get_entity_class_and_category(gene_id)
+                    nodes.append(entity_class(id=gene_id, name=gene_label, category=category))
+                    entities_written.add(gene_id)
+
+                # Create enabled_by association
+                evidence_info = enabled_by.get('evidence', [{}])[0] if enabled_by.get('evidence') else {}
+
+                enabled_by_assoc = Association(
+                    id=str(uuid.uuid4()),
+                    subject=activity_id,
+                    predicate="biolink:enabled_by",
+                    object=gene_id,
+                    category=["biolink:Association"],
+                    knowledge_level="knowledge_assertion",
+                    agent_type="manual_agent",
+                )
+
+                # Add evidence if present
+                if evidence_info.get('term'):
+                    enabled_by_assoc.has_evidence = [evidence_info['term']]
+                if evidence_info.get('reference'):
+                    enabled_by_assoc.publications = [evidence_info['reference']]
+
+                edges.append(enabled_by_assoc)
+
+        # Process molecular_function relationship
+        if 'molecular_function' in activity:
+            mf = activity['molecular_function']
+            mf_term = mf.get('term')
+
+            if mf_term:
+                # Create molecular activity entity
+                if mf_term not in entities_written:
+                    mf_label = objects_dict.get(mf_term, {}).get('label', mf_term)
+                    mf_type = objects_dict.get(mf_term, {}).get('type', '')
+                    entity_class, category = get_entity_class_and_category(mf_term, mf_type)
+                    nodes.append(entity_class(id=mf_term, name=mf_label, category=category))
+                    entities_written.add(mf_term)
+
+                # Create molecular function association
+                edges.append(
+                    Association(
+                        id=str(uuid.uuid4()),
+                        subject=activity_id,
+                        predicate="biolink:has_molecular_function",
+                        object=mf_term,
+                        category=["biolink:Association"],
+                        knowledge_level="knowledge_assertion",
+                        agent_type="manual_agent",
+                    )
+                )
+
+    # Process any remaining objects not yet written
+    for obj_id, obj_data in objects_dict.items():
+        if obj_id not in entities_written:
+            entity_class, category = get_entity_class_and_category(obj_id, obj_data.get('type'))
+            nodes.append(entity_class(id=obj_id, name=obj_data.get('label', obj_id), category=category))
+            entities_written.add(obj_id)
+
+    return nodes, edges
+
+
+def transform_models(
+    models: Iterable[dict],
+    processes: Optional[int] = None,
+    chunksize: int = 16,
+) -> Iterator[tuple[list, list]]:
+    """Transform an iterable of GOCAM models, optionally across a process pool.
+
+    Results are yielded lazily and in input order, one ``(nodes, edges)`` tuple per model.
+
+    Args:
+        models: GOCAM model documents to transform.
+        processes: Number of worker processes. ``None`` or ``1`` transforms in the calling process;
+            ``0`` uses one worker per CPU.
+        chunksize: Number of models sent to a worker at a time when using a process pool. At most
+            ``2 * processes`` chunks are read ahead of the results yielded so far.
+    """
+    if processes is None or processes == 1:
+        yield from map(transform_model, models)
+        return
+
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1.")
+
+    workers = processes or os.cpu_count() or 1
+    models = iter(models)
+
+    # Keep a bounded window of chunks in flight so the input is consumed only as results are yielded
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        while True:
+            while len(pending) < 2 * workers and (chunk := list(islice(models, chunksize))):
+                pending.append(executor.submit(_transform_chunk, chunk))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+
+def _transform_chunk(models: list[dict]) -> list[tuple[list, list]]:
+    """Transform a chunk of models in a worker process."""
+    return [transform_model(model) for model in models]
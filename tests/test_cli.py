@@ -0,0 +1,77 @@
+"""Tests for the gocam_ingest CLI."""
+
+from pathlib import Path
+
+import yaml
+from typer.testing import CliRunner
+
+from gocam_ingest.cli import app
+
+runner = CliRunner()
+
+PACKAGED_CONFIG = Path(__file__).parent.parent / "src" / "gocam_ingest" / "transform.yaml"
+
+
+def test_prepare_writes_run_config(tmp_path):
+    input_dir = tmp_path / "models"
+    input_dir.mkdir()
+    (input_dir / "1234567.yaml").write_text(yaml.safe_dump({"id": "gomodel:1234567", "title": "Test GOCAM Model"}))
+    packaged_config = PACKAGED_CONFIG.read_text()
+
+    output_dirs = [tmp_path / "run_a", tmp_path / "run_b"]
+    for output_dir in output_dirs:
+        result = runner.invoke(app, ["prepare", "--input-dir", str(input_dir), "--output-dir", str(output_dir)])
+        assert result.exit_code == 0, result.output
+
+    for output_dir in output_dirs:
+        with open(output_dir / "transform.yaml") as f:
+            run_config = yaml.safe_load(f)
+        assert run_config["files"] == [str((output_dir / "gocam_models_combined.jsonl").resolve())]
+        assert Path(run_config["metadata"]).exists()
+        assert Path(run_config["transform_code"]).exists()
+
+    # The packaged config is only used as a template
+    assert PACKAGED_CONFIG.read_text() == packaged_config
+
+
+def test_transform_from_run_config(tmp_path, monkeypatch):
+    input_dir = tmp_path / "models"
+    input_dir.mkdir()
+    model = {
+        "id": "gomodel:1234567",
+        "title": "Test GOCAM Model",
+        "activities": [
+            {
+                "id": "gomodel:1234567/1",
+                "enabled_by": {"term": "MGI:1234567"},
+                "molecular_function": {"term": "GO:0003674"},
+            }
+        ],
+        "objects": [
+            {"id": "MGI:1234567", "label": "entity_1", "type": "gene"},
+            {"id": "GO:0003674", "label": "entity_6", "type": "molecular_function"},
+        ],
+    }
+    (input_dir / "1234567.yaml").write_text(yaml.safe_dump(model))
+
+    # Run outside the repo root, relying only on the paths in the run config
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, ["prepare", "--input-dir", str(input_dir), "--output-dir", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+
+    output_dir = tmp_path / "out"
+    result = runner.invoke(
+        app, ["transform", "--config", str(tmp_path / "transform.yaml"), "--output-dir", str(output_dir)]
+    )
+    assert result.exit_code == 0, result.output
+
+    nodes_file = output_dir / "Gene Ontology_GO causal activity models_nodes.tsv"
+    edges_file = output_dir / "Gene Ontology_GO causal activity models_edges.tsv"
+    assert len(nodes_file.read_text().splitlines()) == 4
+    assert len(edges_file.read_text().splitlines()) == 3
+
+
+def test_transform_requires_run_config(tmp_path):
+    result = runner.invoke(app, ["transform", "--config", str(tmp_path / "missing.yaml")])
+    assert result.exit_code == 1
+    assert "run `ingest prepare` first" in result.output
@@ -0,0 +1,77 @@
+"""Tests for the Koza-independent model transform API."""
+
+import itertools
+
+import pytest
+
+from gocam_ingest.model_transform import transform_model, transform_models
+
+
+def make_model(n: int) -> dict:
+    return {
+        "id": f"gomodel:{n}",
+        "title": f"Test GOCAM Model {n}",
+        "taxon": "NCBITaxon:9606",
+        "activities": [
+            {
+                "id": f"gomodel:{n}/1",
+                "enabled_by": {
+                    "term": f"MGI:{n}",
+                    "evidence": [{"term": "ECO:0000314", "reference": f"PMID:{n}"}],
+                },
+                "molecular_function": {"term": "GO:0003674"},
+            }
+        ],
+        "objects": [
+            {"id": f"MGI:{n}", "label": f"gene_{n}", "type": "gene"},
+            {"id": "GO:0003674", "label": "molecular_function", "type": "molecular_function"},
+        ],
+    }
+
+
+def test_transform_model():
+    nodes, edges = transform_model(make_model(1))
+
+    assert [node.id for node in nodes] == ["gomodel:1/1", "MGI:1", "GO:0003674"]
+    assert [edge.predicate for edge in edges] == ["biolink:enabled_by", "biolink:has_molecular_function"]
+
+    enabled_by = edges[0]
+    assert enabled_by.subject == "gomodel:1/1"
+    assert enabled_by.object == "MGI:1"
+    assert enabled_by.has_evidence == ["ECO:0000314"]
+    assert enabled_by.publications == ["PMID:1"]
+
+
+def test_transform_model_empty():
+    assert transform_model({"id": "gomodel:0"}) == ([], [])
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_transform_models(processes):
+    models = (make_model(n) for n in range(1, 6))
+
+    results = list(transform_models(models, processes=processes, chunksize=2))
+
+    assert len(results) == 5
+    assert [nodes[1].id for nodes, _ in results] == [f"MGI:{n}" for n in range(1, 6)]
+    assert all(len(edges) == 2 for _, edges in results)
+
+
+def test_transform_models_streams_unbounded_input():
+    read = []
+
+    def models():
+        for n in itertools.count(1):
+            read.append(n)
+            yield make_model(n)
+
+    nodes, _ = next(transform_models(models(), processes=2, chunksize=2))
+
+    assert nodes[1].id == "MGI:1"
+    # At most 2 * processes chunks are read ahead
+    assert len(read) <= 2 * 2 * 2
+
+
+def test_transform_models_rejects_empty_chunks():
+    with pytest.raises(ValueError, match="chunksize"):
+        list(transform_models([make_model(1)] * 5, processes=2, chunksize=0))